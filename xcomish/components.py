@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-from collections import deque
+from array import array
 from dataclasses import dataclass, field
-from typing import Deque, List, Optional, Tuple
+from typing import List, Optional, Tuple
 
 
 # ---- Core spatial components ----
-@dataclass
+@dataclass(slots=True)
 class Position:
     gx: int
     gy: int
@@ -15,58 +15,63 @@ class Position:
     py: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class Motion:
-    """Path-based motion in grid cells (gx, gy)."""
-    path: Deque[Tuple[int, int]] = field(default_factory=deque)
+    """Path-based motion in grid cells, packed as gy * grid.w + gx."""
+    path: array = field(default_factory=lambda: array("i"))
+    cursor: int = 0  # index of the next step in path
     # Tiles per second. Using per-entity speed lets us play with dashing later.
     speed_tps: float = 6.0
 
 
-@dataclass
+@dataclass(slots=True)
 class Renderable:
     radius_px: int = 12
     color: Tuple[int, int, int] = (255, 255, 255)
 
 
 # ---- Gameplay ----
-@dataclass
+@dataclass(slots=True)
 class AP:
     current: int
     maximum: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Faction:
     name: str  # 'player' or 'enemy'
 
 
-@dataclass
+@dataclass(slots=True)
 class Solid:
     """Blocks movement (occupancy)."""
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Opaque:
     """Blocks line of sight (LoS)."""
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Selected:
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class PathPlan:
     """Transient UI: preview path + target; not authoritative motion."""
     target: Tuple[int, int] | None = None
     path: List[Tuple[int, int]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Patrol:
     """Tiny enemy patrol AI: looped waypoints."""
     waypoints: List[Tuple[int, int]] = field(default_factory=list)
     idx: int = 0
+    # Terrain-only A* per leg; cached_legs[i] runs waypoints[i - 1] -> waypoints[i].
+    # None means (re)compute, e.g. after editing waypoints; new walls need no reset,
+    # PatrolAI checks each slice against live blockers and falls back to A*.
+    cached_legs: Optional[List[List[Tuple[int, int]]]] = None
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from array import array
+from bisect import bisect_left
 from dataclasses import dataclass
-from typing import DefaultDict, Dict, FrozenSet, Iterable, List, Tuple, Type, TypeVar, Any
+from typing import Callable, DefaultDict, Dict, Iterable, List, Set, Tuple, Type, TypeVar, Any
 
 T = TypeVar("T")
 
@@ -16,21 +18,64 @@ class CacheStats:
         self.misses = 0
 
 
+def _compile_view_builder(comp_types: Tuple[Type[Any], ...]) -> Callable[..., Any]:
+    """
+    Generate a builder specialized to one component set, e.g. for (Position, AP):
+
+        def _build(stores):
+            s0 = stores.get(T0, _EMPTY); s1 = stores.get(T1, _EMPTY)
+            ents = sorted(s0.keys() & s1.keys())
+            return ents, {T0: [s0[e] for e in ents], T1: [s1[e] for e in ents]}
+
+    i.e. no generic per-type loops; the key-view intersection runs in C.
+    """
+    n = len(comp_types)
+    if n == 0:
+        return lambda stores: ([], {})
+    lines = ["def _build(stores):"]
+    lines += [f"    s{i} = stores.get(T{i}, _EMPTY)" for i in range(n)]
+    lines.append("    ents = sorted(" + " & ".join(f"s{i}.keys()" for i in range(n)) + ")")
+    lines.append("    return ents, {" + ", ".join(f"T{i}: [s{i}[e] for e in ents]" for i in range(n)) + "}")
+    namespace: Dict[str, Any] = {f"T{i}": ct for i, ct in enumerate(comp_types)}
+    namespace["_EMPTY"] = {}  # read-only stand-in for a type with no store yet
+    exec("\n".join(lines), namespace)
+    return namespace["_build"]
+
+
 class World:
     """
     Simple ECS:
       - Component stores per type: Dict[type, Dict[entity, component]]
-      - view() with cached, IMMUTABLE tuples
+      - view() with cached, IMMUTABLE tuples, laid out as aligned columns (SoA)
+      - View keys are int bitmasks (one bit per component type); each entity
+        carries its composition mask, so membership is one AND/compare
+      - Clean views are served straight from a signature-keyed result dict
       - Reverse dirty index: component_type -> affected view keys
+      - Views are patched per touched entity (sorted ids + bisect), not rebuilt
+      - query() returns a view fetcher pre-bound to one signature
       - add/remove/destroy
     """
 
     def __init__(self) -> None:
         self._next_eid: int = 1
         self.stores: Dict[Type[Any], Dict[int, Any]] = {}
-        self._view_cache: Dict[FrozenSet[Type[Any]], Tuple[Tuple[int, ...], Tuple[Tuple[Any, ...], ...]]] = {}
-        self._view_dirty: Dict[FrozenSet[Type[Any]], bool] = {}
-        self._comp_to_views: DefaultDict[Type[Any], List[FrozenSet[Type[Any]]]] = DefaultDict(list)
+        self._type_bit: Dict[Type[Any], int] = {}
+        self._next_bit: int = 0
+        self._masks: Dict[int, int] = {}  # entity -> OR of its component bits
+        # view() signature -> mask, so call sites pay for the OR-fold only once
+        self._sig_mask: Dict[Tuple[Type[Any], ...], int] = {}
+        # view() signature -> current result; dropped as soon as its mask goes dirty
+        self._sig_result: Dict[Tuple[Type[Any], ...], Tuple[Tuple[int, ...], Tuple[Tuple[Any, ...], ...]]] = {}
+        self._mask_sigs: DefaultDict[int, Set[Tuple[Type[Any], ...]]] = DefaultDict(set)
+        self._view_cache: Dict[int, Tuple[Tuple[int, ...], Tuple[Tuple[Any, ...], ...]]] = {}
+        self._view_order: Dict[int, Tuple[Type[Any], ...]] = {}
+        self._view_ents: Dict[int, array] = {}
+        self._view_cols: Dict[int, Dict[Type[Any], List[Any]]] = {}
+        # entities whose membership/row may have changed since the last fetch
+        self._view_pending: Dict[int, Set[int]] = {}
+        # mask -> generated straight-line builder for that component set
+        self._view_builder: Dict[int, Callable[[Dict[Type[Any], Dict[int, Any]]], Tuple[List[int], Dict[Type[Any], List[Any]]]]] = {}
+        self._comp_to_views: DefaultDict[Type[Any], List[int]] = DefaultDict(list)
         self.cache_stats = CacheStats()
 
     # ---- Entity & Components ----
@@ -39,10 +84,24 @@ class World:
         self._next_eid += 1
         return eid
 
+    def _bit(self, comp_type: Type[Any]) -> int:
+        bit = self._type_bit.get(comp_type)
+        if bit is None:
+            bit = self._type_bit[comp_type] = 1 << self._next_bit
+            self._next_bit += 1
+        return bit
+
     def add(self, entity: int, component: Any) -> None:
-        store = self.stores.setdefault(type(component), {})
+        comp_type = type(component)
+        bit = self._bit(comp_type)
+        store = self.stores.setdefault(comp_type, {})
+        prev = store.get(entity)
+        if prev is component:
+            return  # re-adding the same instance changes neither membership nor columns
         store[entity] = component
-        self._mark_dirty_for(type(component))
+        self._masks[entity] = self._masks.get(entity, 0) | bit
+        # A different instance replacing prev keeps membership but still refreshes columns
+        self._mark_dirty_for(comp_type, entity)
 
     def get(self, entity: int, comp_type: Type[T]) -> T | None:
         store = self.stores.get(comp_type)
@@ -52,54 +111,131 @@ class World:
         store = self.stores.get(comp_type)
         if store and entity in store:
             del store[entity]
-            self._mark_dirty_for(comp_type)
+            self._masks[entity] &= ~self._type_bit[comp_type]
+            self._mark_dirty_for(comp_type, entity)
 
     def destroy(self, entity: int) -> None:
+        self._masks.pop(entity, None)
         for comp_type, store in self.stores.items():
             if entity in store:
                 del store[entity]
-                self._mark_dirty_for(comp_type)
+                self._mark_dirty_for(comp_type, entity)
 
     # ---- Views ----
     def view(self, *comp_types: Type[Any]) -> Tuple[Tuple[int, ...], Tuple[Tuple[Any, ...], ...]]:
         """
-        Returns immutable tuple of (entities, components tuples).
+        Returns immutable (entities, columns): one column per requested component
+        type, aligned with entities (SoA), i.e. columns[j][i] belongs to entities[i].
+        Entities are in ascending id order. Until a matching component changes,
+        every call gets back the same tuples, so repeated fetches copy nothing.
         """
-        key = frozenset(comp_types)
+        hit = self._sig_result.get(comp_types)
+        if hit is not None:
+            # Nothing in this composition changed since the last fetch: one dict lookup
+            self.cache_stats.hits += 1
+            return hit
+
+        key = self._sig_mask.get(comp_types)
+        if key is None:
+            key = 0
+            for ct in comp_types:
+                key |= self._bit(ct)
+            self._sig_mask[comp_types] = key
         cached = self._view_cache.get(key)
-        dirty = self._view_dirty.get(key, True)
-        if cached is not None and not dirty:
+        if cached is None:
+            return self._build_view(key, comp_types)
+        pending = self._view_pending[key]
+        if not pending and self._view_order[key] == comp_types:
             self.cache_stats.hits += 1
+            self._remember(key, comp_types, cached)
             return cached
 
-        # Build
-        entities = None
-        for ct in comp_types:
-            store = self.stores.get(ct, {})
-            ids = set(store.keys())
-            entities = ids if entities is None else (entities & ids)
-
-        ent_sorted = tuple(sorted(entities or ()))
-        comps_rows: List[Tuple[Any, ...]] = []
-        for e in ent_sorted:
-            row: List[Any] = []
-            for ct in comp_types:
-                row.append(self.stores[ct][e])
-            comps_rows.append(tuple(row))
+        ents = self._view_ents[key]
+        if len(pending) > len(ents):
+            # Bulk churn: one sorted rebuild beats many O(n) array inserts/deletes
+            return self._build_view(key, comp_types)
+
+        # Patch only the entities touched since the last fetch
+        cols = self._view_cols[key]
+        masks = self._masks
+        for e in pending:
+            i = bisect_left(ents, e)
+            present = i < len(ents) and ents[i] == e
+            if (masks.get(e, 0) & key) == key:
+                if present:
+                    for ct, col in cols.items():
+                        col[i] = self.stores[ct][e]
+                else:
+                    ents.insert(i, e)
+                    for ct, col in cols.items():
+                        col.insert(i, self.stores[ct][e])
+            elif present:
+                del ents[i]
+                for col in cols.values():
+                    del col[i]
+        pending.clear()
+
+        # Columns are stored per type, so a re-ordered signature only re-packs them.
+        result = (tuple(ents), tuple([tuple(cols[ct]) for ct in comp_types]))
+        self._view_cache[key] = result
+        self._view_order[key] = comp_types
+        self._remember(key, comp_types, result)
+        self.cache_stats.misses += 1
+        return result
 
-        result = (ent_sorted, tuple(comps_rows))
+    def query(self, *comp_types: Type[Any]) -> Callable[[], Tuple[Tuple[int, ...], Tuple[Tuple[Any, ...], ...]]]:
+        """
+        view(*comp_types) pre-bound to one signature, for systems to create once
+        in __init__ and call every tick. The clean case is a single dict lookup:
+        no varargs packing, mask fold or pending check per call.
+        """
+        sig = tuple(comp_types)
+        get = self._sig_result.get
+        view = self.view
+
+        def _query() -> Tuple[Tuple[int, ...], Tuple[Tuple[Any, ...], ...]]:
+            hit = get(sig)
+            if hit is not None:
+                self.cache_stats.hits += 1
+                return hit
+            return view(*sig)
+
+        return _query
+
+    def _build_view(self, key: int, comp_types: Tuple[Type[Any], ...]) -> Tuple[Tuple[int, ...], Tuple[Tuple[Any, ...], ...]]:
+        """Full rebuild; used the first time a key is queried or after bulk churn."""
+        builder = self._view_builder.get(key)
+        if builder is None:
+            builder = self._view_builder[key] = _compile_view_builder(comp_types)
+        ent_list, cols = builder(self.stores)
+        ents = array("i", ent_list)
+
+        result = (tuple(ents), tuple([tuple(cols[ct]) for ct in comp_types]))
         self._view_cache[key] = result
-        self._view_dirty[key] = False
+        self._view_order[key] = comp_types
+        self._view_ents[key] = ents
+        self._view_cols[key] = cols
+        self._view_pending[key] = set()
 
         # Register dirty mapping for each component type in key
-        for ct in key:
+        for ct in comp_types:
             lst = self._comp_to_views[ct]
             if key not in lst:
                 lst.append(key)
 
+        self._remember(key, comp_types, result)
         self.cache_stats.misses += 1
         return result
 
-    def _mark_dirty_for(self, comp_type: Type[Any]) -> None:
-        for key in self._comp_to_views.get(comp_type, []):
-            self._view_dirty[key] = True
+    def _remember(self, key: int, comp_types: Tuple[Type[Any], ...], result: Any) -> None:
+        self._sig_result[comp_types] = result
+        self._mask_sigs[key].add(comp_types)
+
+    def _mark_dirty_for(self, comp_type: Type[Any], entity: int) -> None:
+        for mask in self._comp_to_views.get(comp_type, ()):
+            self._view_pending[mask].add(entity)
+            sigs = self._mask_sigs.get(mask)
+            if sigs:
+                for sig in sigs:
+                    self._sig_result.pop(sig, None)
+                sigs.clear()
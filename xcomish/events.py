@@ -53,7 +53,8 @@ class EventBus:
     """
 
     def __init__(self) -> None:
-        self._subs: DefaultDict[Type[Event], List[Tuple[int, bool, Any]]] = DefaultDict(list)
+        # (handle_id, once, is_weak, handler_or_weakmethod)
+        self._subs: DefaultDict[Type[Event], List[Tuple[int, bool, bool, Any]]] = DefaultDict(list)
         self._next_id: int = 1
 
     def subscribe(
@@ -63,28 +64,30 @@ class EventBus:
         self._next_id += 1
 
         wrapped: Any
-        if weak and isinstance(handler, types.MethodType):
+        is_weak = weak and isinstance(handler, types.MethodType)
+        if is_weak:
             wrapped = weakref.WeakMethod(handler)  # returns None if dead
         else:
             wrapped = handler
 
-        self._subs[event_type].append((handle_id, once, wrapped))
+        self._subs[event_type].append((handle_id, once, is_weak, wrapped))
         return handle_id
 
     def unsubscribe(self, event_type: Type[E], handle_id: Optional[int] = None, handler: Optional[Handler] = None) -> None:
         subs = self._subs.get(event_type)
         if not subs:
             return
-        keep: List[Tuple[int, bool, Any]] = []
-        for hid, once, wrapped in subs:
+        keep: List[Tuple[int, bool, bool, Any]] = []
+        for sub in subs:
+            hid, _, is_weak, wrapped = sub
             if handle_id is not None and hid == handle_id:
                 continue
             if handler is not None:
-                # Match both direct and weak wrapped
-                target = wrapped() if isinstance(wrapped, weakref.WeakMethod) else wrapped
-                if target is handler:
+                # Match both direct and weak wrapped; == so fresh bound-method objects match
+                target = wrapped() if is_weak else wrapped
+                if target == handler:
                     continue
-            keep.append((hid, once, wrapped))
+            keep.append(sub)
         self._subs[event_type] = keep
 
     def publish(self, event: Event) -> None:
@@ -92,10 +95,20 @@ class EventBus:
         if not subs:
             return
 
+        # Fast path: a lone strong, persistent handler needs no copy or removal bookkeeping
+        if len(subs) == 1:
+            _, once, is_weak, wrapped = subs[0]
+            if not once and not is_weak:
+                try:
+                    wrapped(event)
+                except Exception:
+                    traceback.print_exc()
+                return
+
         remove_ids: List[int] = []
-        for handle_id, once, wrapped in list(subs):
+        for handle_id, once, is_weak, wrapped in list(subs):
             try:
-                callback = wrapped() if isinstance(wrapped, weakref.WeakMethod) else wrapped
+                callback = wrapped() if is_weak else wrapped
                 if callback is None:
                     remove_ids.append(handle_id)
                     continue
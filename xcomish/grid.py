@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 import pygame
 
@@ -15,7 +16,63 @@ from .constants import (
     MAP_W,
     TILE,
 )
-from .components import Opaque, Solid
+from .components import Opaque, Position, Solid
+
+
+# walkable byte -> blocker byte (0 <-> 1), for bytes.translate
+_INVERT01 = bytes((1, 0)) + bytes(254)
+
+# Per-cell fog state (visible << 1 | explored) -> overlay RGBA
+_FOG_BY_STATE = (FOG_BLACK, FOG_DARK, (0, 0, 0, 0), (0, 0, 0, 0))
+
+
+def _set_bits(bits: int) -> Iterator[int]:
+    """Indices of the 1 bits of bits, lowest first."""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+@lru_cache(maxsize=None)
+def _fov_rays(radius: int, w: int) -> Tuple[Tuple[int, int, Tuple[int, ...]], ...]:
+    """
+    One ray per target offset (dx, dy) with dx*dx + dy*dy <= radius**2:
+    (dx, dy, interior) where interior are the Bresenham cells strictly between
+    origin and target, as packed dy * w + dx offsets. Bresenham only depends on
+    the deltas, so the table is shared by every origin on a grid of width w.
+    """
+    r2 = radius * radius
+    rays = []
+    for dy in range(-radius, radius + 1):
+        for dx in range(-radius, radius + 1):
+            if dx * dx + dy * dy > r2:
+                continue
+            ax, ay = abs(dx), -abs(dy)
+            sx = 1 if dx > 0 else -1
+            sy = 1 if dy > 0 else -1
+            err = ax + ay
+            x = y = 0
+            interior = []
+            while x != dx or y != dy:
+                e2 = 2 * err
+                if e2 >= ay:
+                    err += ay
+                    x += sx
+                if e2 <= ax:
+                    err += ax
+                    y += sy
+                if x != dx or y != dy:
+                    interior.append(y * w + x)
+            rays.append((dx, dy, tuple(interior)))
+    return tuple(rays)
+
+
+def _tile_blit(dst: pygame.Surface, pattern: pygame.Surface) -> None:
+    """Cover dst with copies of pattern using one batched Surface.blits() call."""
+    pw, ph = pattern.get_size()
+    dw, dh = dst.get_size()
+    dst.blits([(pattern, (x, y)) for y in range(0, dh, ph) for x in range(0, dw, pw)], doreturn=False)
 
 
 @dataclass
@@ -32,6 +89,18 @@ class Camera:
     def world_to_screen(self, wx: int, wy: int) -> Tuple[int, int]:
         return wx - self.x, wy - self.y
 
+    def positions_to_screen_batch(self, positions: Iterable[Position], alpha: float) -> List[Tuple[int, int]]:
+        """Screen tile-centre of each Position, interpolated prev -> current by alpha, in one pass."""
+        half = TILE // 2
+        cx, cy = self.x, self.y
+        return [
+            (
+                int((p.px + (p.gx - p.px) * alpha) * TILE + half) - cx,
+                int((p.py + (p.gy - p.py) * alpha) * TILE + half) - cy,
+            )
+            for p in positions
+        ]
+
     def screen_to_grid(self, sx: int, sy: int) -> Tuple[int, int]:
         gx = (sx + self.x) // TILE
         gy = (sy + self.y) // TILE
@@ -42,38 +111,57 @@ class Camera:
 class Grid:
     w: int = MAP_W
     h: int = MAP_H
-    walkable: List[List[bool]] = field(default_factory=list)
-    opaque: List[List[bool]] = field(default_factory=list)
-    occupants: Dict[Tuple[int, int], int] = field(default_factory=dict)  # (x,y)->entity
+    # Row-major flat buffers indexed by y * w + x (1 = walkable / opaque).
+    # Write opacity through place_wall() so memoized FOV gets invalidated.
+    walkable: bytearray = field(default_factory=bytearray)
+    opaque: bytearray = field(default_factory=bytearray)
+    occupants: Dict[int, int] = field(default_factory=dict)  # (y * w + x)->entity
 
     # prerendered
     terrain_surf: Optional[pygame.Surface] = None
     gridlines_surf: Optional[pygame.Surface] = None
-    fog_full: Optional[pygame.Surface] = None
-    fog_dim: Optional[pygame.Surface] = None
+    fog_surf: Optional[pygame.Surface] = None  # map-sized, patched per changed tile
 
-    # fog state
-    visible: Set[Tuple[int, int]] = field(default_factory=set)
-    explored: Set[Tuple[int, int]] = field(default_factory=set)
+    # fog state: int bitsets, bit y * w + x set = visible / explored
+    visible: int = 0
+    explored: int = 0
+    # (origin y * w + x, radius) -> visible bitset; valid until opacity changes
+    _vis_lut: Dict[Tuple[int, int], int] = field(default_factory=dict, init=False, repr=False)
+    # 1 where a wall or unit stands; kept in step by place_wall/occupy/vacate
+    _blockers: bytearray = field(default_factory=bytearray, init=False, repr=False)
+    revision: int = field(default=0, init=False)  # bumped on every terrain/occupancy change
 
     def __post_init__(self) -> None:
         if not self.walkable:
-            self.walkable = [[True for _ in range(self.w)] for _ in range(self.h)]
+            self.walkable = bytearray(b"\x01" * (self.w * self.h))
         if not self.opaque:
-            self.opaque = [[False for _ in range(self.w)] for _ in range(self.h)]
+            self.opaque = bytearray(self.w * self.h)
+        self._blockers = bytearray(self.walkable.translate(_INVERT01))
+        for k in self.occupants:
+            self._blockers[k] = 1
 
     # --- Terrain ops ---
     def in_bounds(self, x: int, y: int) -> bool:
         return 0 <= x < self.w and 0 <= y < self.h
 
     def is_walkable(self, x: int, y: int) -> bool:
-        return self.in_bounds(x, y) and self.walkable[y][x] and (x, y) not in self.occupants
+        return 0 <= x < self.w and 0 <= y < self.h and bool(self.walkable[y * self.w + x]) and (y * self.w + x) not in self.occupants
 
     def is_blocked(self, x: int, y: int) -> bool:
-        return not self.in_bounds(x, y) or not self.walkable[y][x]
+        return not (0 <= x < self.w and 0 <= y < self.h) or not self.walkable[y * self.w + x]
 
     def is_opaque(self, x: int, y: int) -> bool:
-        return not self.in_bounds(x, y) or self.opaque[y][x]
+        return not (0 <= x < self.w and 0 <= y < self.h) or bool(self.opaque[y * self.w + x])
+
+    def place_wall(self, x: int, y: int) -> None:
+        """Make (x, y) unwalkable and opaque (drops memoized FOV)."""
+        k = y * self.w + x
+        self.walkable[k] = 0
+        self._blockers[k] = 1
+        self.revision += 1
+        if not self.opaque[k]:
+            self.opaque[k] = 1
+            self._vis_lut.clear()
 
     def neighbors4(self, x: int, y: int) -> Iterator[Tuple[int, int]]:
         if x > 0:
@@ -88,27 +176,64 @@ class Grid:
     # --- Occupancy (O(1)) ---
     def occupy(self, x: int, y: int, entity: int) -> bool:
         """Returns True if success; never silently overwrite."""
-        key = (x, y)
+        key = y * self.w + x
         if key in self.occupants and self.occupants[key] != entity:
             return False
         self.occupants[key] = entity
+        self._blockers[key] = 1
+        self.revision += 1
         return True
 
     def vacate(self, x: int, y: int, entity: int) -> None:
-        if self.occupants.get((x, y)) == entity:
-            del self.occupants[(x, y)]
+        key = y * self.w + x
+        if self.occupants.get(key) == entity:
+            del self.occupants[key]
+            self._blockers[key] = not self.walkable[key]
+            self.revision += 1
+
+    def move(self, entity: int, x0: int, y0: int, x1: int, y1: int) -> bool:
+        """
+        Atomic vacate(x0, y0) + occupy(x1, y1): checks the destination first, so a
+        refused move touches nothing and needs no rollback. Returns True if moved.
+        """
+        w = self.w
+        src, dst = y0 * w + x0, y1 * w + x1
+        occ = self.occupants
+        other = occ.get(dst)
+        if other is not None and other != entity:
+            return False
+        if occ.get(src) == entity:
+            del occ[src]
+            self._blockers[src] = not self.walkable[src]
+        occ[dst] = entity
+        self._blockers[dst] = 1
+        self.revision += 1
+        return True
+
+    def terrain_blockers(self) -> bytes:
+        """Flat per-cell buffer, 1 where terrain blocks movement (units ignored)."""
+        return self.walkable.translate(_INVERT01)
+
+    def blockers(self) -> bytearray:
+        """
+        Flat per-cell buffer, 1 where a wall or a unit stands. Path searches read
+        this single buffer instead of walkable + the occupants dict; the grid
+        patches it in place on every change, so reads never rebuild. Read-only.
+        """
+        return self._blockers
 
     # --- LoS ---
-    def bresenham(self, x0: int, y0: int, x1: int, y1: int) -> Iterator[Tuple[int, int]]:
-        """Yield grid cells along the line from (x0,y0) to (x1,y1)."""
+    def bresenham(self, x0: int, y0: int, x1: int, y1: int) -> List[Tuple[int, int]]:
+        """Grid cells along the line from (x0,y0) to (x1,y1), endpoints included."""
         dx = abs(x1 - x0)
         dy = -abs(y1 - y0)
         sx = 1 if x0 < x1 else -1
         sy = 1 if y0 < y1 else -1
         err = dx + dy
         x, y = x0, y0
+        cells = []
         while True:
-            yield x, y
+            cells.append((x, y))
             if x == x1 and y == y1:
                 break
             e2 = 2 * err
@@ -118,60 +243,120 @@ class Grid:
             if e2 <= dx:
                 err += dx
                 y += sy
+        return cells
 
     def has_los(self, x0: int, y0: int, x1: int, y1: int) -> bool:
-        """True if opaque tiles don't block between endpoints (endpoints allowed)."""
-        for (x, y) in self.bresenham(x0, y0, x1, y1):
-            if (x, y) == (x0, y0) or (x, y) == (x1, y1):
-                continue
-            if self.is_opaque(x, y):
+        """True if opaque tiles don't block between endpoints (endpoints allowed).
+
+        False if either endpoint is off the map; with both in bounds, every cell
+        strictly between them is too.
+        """
+        if not (self.in_bounds(x0, y0) and self.in_bounds(x1, y1)):
+            return False
+        # Same stepping as bresenham(), inlined on the flat buffer: integer locals
+        # only, no generator frames or per-cell tuples, bail on the first blocker.
+        w = self.w
+        opaque = self.opaque
+        dx = abs(x1 - x0)
+        dy = -abs(y1 - y0)
+        sx = 1 if x0 < x1 else -1
+        sy = 1 if y0 < y1 else -1
+        err = dx + dy
+        x, y = x0, y0
+        while x != x1 or y != y1:
+            e2 = 2 * err
+            if e2 >= dy:
+                err += dy
+                x += sx
+            if e2 <= dx:
+                err += dx
+                y += sy
+            if (x != x1 or y != y1) and opaque[y * w + x]:
                 return False
         return True
 
     # --- Fog-of-war ---
+    def is_visible(self, x: int, y: int) -> bool:
+        return 0 <= x < self.w and 0 <= y < self.h and bool(self.visible >> (y * self.w + x) & 1)
+
+    def is_explored(self, x: int, y: int) -> bool:
+        return 0 <= x < self.w and 0 <= y < self.h and bool(self.explored >> (y * self.w + x) & 1)
+
     def clear_fog(self) -> None:
-        self.visible.clear()
+        self._set_fog(0, self.explored)
 
     def reveal_from(self, x0: int, y0: int, radius: int) -> None:
+        """FOV from (x0, y0); the mask per origin is memoized while opacity is static."""
+        if not self.in_bounds(x0, y0):
+            self._set_fog(0, self.explored)  # nothing is seen from off the map
+            return
+        key = (y0 * self.w + x0, radius)
+        mask = self._vis_lut.get(key)
+        if mask is None:
+            mask = self._vis_lut[key] = self._compute_fov(x0, y0, radius)
+        self._set_fog(mask, self.explored | mask)
+
+    def _set_fog(self, visible: int, explored: int) -> None:
+        """Store new bitsets and repaint only the overlay tiles whose state changed."""
+        diff = (self.visible ^ visible) | (self.explored ^ explored)
+        if not diff:
+            return
+        self.visible = visible
+        self.explored = explored
+        surf = self.fog_surf
+        if surf is None:
+            return
+        w = self.w
+        for k in _set_bits(diff):
+            y, x = divmod(k, w)
+            state = (visible >> k & 1) << 1 | (explored >> k & 1)
+            surf.fill(_FOG_BY_STATE[state], (x * TILE, y * TILE, TILE, TILE))
+
+    def _compute_fov(self, x0: int, y0: int, radius: int) -> int:
         """Naive FOV using Bresenham LoS; good enough for the slice."""
-        self.visible.clear()
-        r2 = radius * radius
-        for y in range(max(0, y0 - radius), min(self.h, y0 + radius + 1)):
-            for x in range(max(0, x0 - radius), min(self.w, x0 + radius + 1)):
-                dx, dy = x - x0, y - y0
-                if dx * dx + dy * dy <= r2 and self.has_los(x0, y0, x, y):
-                    self.visible.add((x, y))
-                    self.explored.add((x, y))
+        w, h = self.w, self.h
+        mask = 0
+        opaque = self.opaque
+        k0 = y0 * w + x0
+        for dx, dy, interior in _fov_rays(radius, w):
+            x, y = x0 + dx, y0 + dy
+            if not (0 <= x < w and 0 <= y < h):
+                continue
+            for off in interior:
+                if opaque[k0 + off]:
+                    break
+            else:
+                mask |= 1 << (k0 + dy * w + dx)
+        return mask
 
     # --- Rendering cache ---
     def ensure_surfaces(self, w_px: int, h_px: int) -> None:
         if self.terrain_surf is None:
             self.terrain_surf = pygame.Surface((w_px, h_px))
-            self.terrain_surf.fill(GRAY)
-            # Draw "terrain blobs"
-            for y in range(self.h):
-                for x in range(self.w):
-                    rect = pygame.Rect(x * TILE, y * TILE, TILE, TILE)
-                    color = GRAY if ((x + y) % 2 == 0) else LIGHT_GRAY
-                    pygame.draw.rect(self.terrain_surf, color, rect)
+            # Checkerboard "terrain blobs": one 2x2-tile pattern, tiled in a single blits() call
+            pattern = pygame.Surface((TILE * 2, TILE * 2))
+            pattern.fill(GRAY)
+            pattern.fill(LIGHT_GRAY, pygame.Rect(TILE, 0, TILE, TILE))
+            pattern.fill(LIGHT_GRAY, pygame.Rect(0, TILE, TILE, TILE))
+            _tile_blit(self.terrain_surf, pattern)
 
         if self.gridlines_surf is None:
             self.gridlines_surf = pygame.Surface((w_px, h_px), pygame.SRCALPHA)
-            for x in range(self.w + 1):
-                pygame.draw.line(
-                    self.gridlines_surf, (0, 0, 0, 40), (x * TILE, 0), (x * TILE, h_px)
-                )
-            for y in range(self.h + 1):
-                pygame.draw.line(
-                    self.gridlines_surf, (0, 0, 0, 40), (0, y * TILE), (w_px, y * TILE)
-                )
-
-        if self.fog_full is None:
-            self.fog_full = pygame.Surface((TILE, TILE), pygame.SRCALPHA)
-            self.fog_full.fill(FOG_BLACK)
-        if self.fog_dim is None:
-            self.fog_dim = pygame.Surface((TILE, TILE), pygame.SRCALPHA)
-            self.fog_dim.fill(FOG_DARK)
+            # Lines sit on each tile's top/left edge; the far edges fall outside the surface.
+            cell = pygame.Surface((TILE, TILE), pygame.SRCALPHA)
+            pygame.draw.line(cell, (0, 0, 0, 40), (0, 0), (0, TILE))
+            pygame.draw.line(cell, (0, 0, 0, 40), (0, 0), (TILE, 0))
+            _tile_blit(self.gridlines_surf, cell)
+
+        if self.fog_surf is None:
+            self.fog_surf = pygame.Surface((w_px, h_px), pygame.SRCALPHA)
+            self.fog_surf.fill(FOG_BLACK)
+            # Paint any state revealed before the overlay existed; later changes are patched
+            w = self.w
+            for k in _set_bits(self.visible | self.explored):
+                y, x = divmod(k, w)
+                state = (self.visible >> k & 1) << 1 | (self.explored >> k & 1)
+                self.fog_surf.fill(_FOG_BY_STATE[state], (x * TILE, y * TILE, TILE, TILE))
 
     # --- Utilities ---
     def map_pixel_size(self) -> Tuple[int, int]:
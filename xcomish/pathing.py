@@ -1,47 +1,58 @@
 from __future__ import annotations
 
 from collections import deque
-from typing import Deque, Dict, Iterable, List, Optional, Set, Tuple
+from heapq import heappop, heappush
+from typing import Deque, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 from .grid import Grid
 
 
-def reachable_flood(grid: Grid, start: Tuple[int, int], ap: int) -> Set[Tuple[int, int]]:
+def reachable_flood(grid: Grid, start: Tuple[int, int], ap: int) -> Set[int]:
     """
     AP-limited reachability on 4-neighborhood.
     Uses deque (no pop(0)) and avoids per-frame structures by reusing locals.
+    Returns packed y * w + x cells; every enqueued cell is reachable, so the
+    seen set doubles as the result.
     """
     sx, sy = start
     if not grid.in_bounds(sx, sy):
         return set()
 
-    q: Deque[Tuple[int, int, int]] = deque()
-    q.append((sx, sy, 0))
-    seen: Set[Tuple[int, int]] = {(sx, sy)}
-    out: Set[Tuple[int, int]] = set()
+    w = grid.w
+    n = w * grid.h
+    blk = grid.blockers()
+    sk = sy * w + sx
+    q: Deque[Tuple[int, int]] = deque()
+    q.append((sk, 0))
+    seen: Set[int] = {sk}
 
     while q:
-        x, y, cost = q.popleft()
-        out.add((x, y))
+        k, cost = q.popleft()
         if cost >= ap:
             continue
-        for nx, ny in grid.neighbors4(x, y):
-            if (nx, ny) in seen:
+        x = k % w
+        # Inlined 4-neighborhood (no neighbors4 generator); -1 marks a row wrap.
+        for nk in (k - 1 if x > 0 else -1, k + 1 if x < w - 1 else -1, k - w, k + w):
+            # start is already in seen, so its own occupant never blocks
+            if nk < 0 or nk >= n or nk in seen or blk[nk]:
                 continue
-            if not grid.in_bounds(nx, ny):
-                continue
-            if not grid.walkable[ny][nx]:
-                continue
-            if (nx, ny) in grid.occupants and (nx, ny) != (sx, sy):
-                continue
-            seen.add((nx, ny))
-            q.append((nx, ny, cost + 1))
-    return out
+            seen.add(nk)
+            q.append((nk, cost + 1))
+    return seen
 
 
-def astar(grid: Grid, start: Tuple[int, int], goal: Tuple[int, int], max_len: int | None = None) -> List[Tuple[int, int]]:
+def astar(
+    grid: Grid,
+    start: Tuple[int, int],
+    goal: Tuple[int, int],
+    max_len: int | None = None,
+    ignore_occupants: bool = False,
+) -> List[Tuple[int, int]]:
     """
     A* with Manhattan heuristic and closed set.
+    Binary-heap open list (heapq) with lazy deletion of stale entries.
+    Nodes are packed y * w + x ints internally.
+    ignore_occupants plans against terrain only (static routes, e.g. patrol legs).
     Returns path including start and goal. Empty if none.
     """
     if start == goal:
@@ -49,38 +60,56 @@ def astar(grid: Grid, start: Tuple[int, int], goal: Tuple[int, int], max_len: in
 
     sx, sy = start
     gx, gy = goal
-    if not grid.in_bounds(gx, gy) or not grid.walkable[gy][gx]:
+    if not grid.in_bounds(gx, gy) or not grid.walkable[gy * grid.w + gx]:
         return []
 
-    open_set: Set[Tuple[int, int]] = {start}
-    came_from: Dict[Tuple[int, int], Tuple[int, int]] = {}
-    g: Dict[Tuple[int, int], int] = {start: 0}
-    f: Dict[Tuple[int, int], int] = {start: abs(gx - sx) + abs(gy - sy)}
+    w = grid.w
+    n = w * grid.h
+    # One flat blocker buffer (walls, plus units unless ignored) covers every cell test
+    blk: Sequence[int] = grid.terrain_blockers() if ignore_occupants else grid.blockers()
+    sk = sy * w + sx
+    gk = gy * w + gx
 
-    while open_set:
-        current = min(open_set, key=lambda p: f.get(p, 10_000_000))
-        if current == goal:
+    # Heap entries carry the g they were pushed with: (f, counter, g, node).
+    # Every node in the heap has a g entry, so no f dict or sentinel defaults are needed.
+    counter = 0
+    open_heap: List[Tuple[int, int, int, int]] = []
+    heappush(open_heap, (abs(gx - sx) + abs(gy - sy), counter, 0, sk))
+    closed: Set[int] = set()
+    came_from: Dict[int, int] = {}
+    g: Dict[int, int] = {sk: 0}
+    g_get = g.get
+
+    while open_heap:
+        _, _, gc, current = heappop(open_heap)
+        # Duplicates are pushed instead of decrease-key; skip stale entries.
+        if current in closed or gc != g[current]:
+            continue
+        if current == gk:
             # Reconstruct
-            path = [current]
+            path = [(gx, gy)]
             while current in came_from:
                 current = came_from[current]
-                path.append(current)
+                path.append((current % w, current // w))
             path.reverse()
             if max_len is not None and len(path) > max_len:
                 path = path[:max_len]
             return path
 
-        open_set.remove(current)
-        for nx, ny in grid.neighbors4(*current):
-            if not grid.in_bounds(nx, ny) or not grid.walkable[ny][nx]:
+        closed.add(current)
+        cx = current % w
+        ng = gc + 1
+        # Inlined 4-neighborhood on the blocker buffer; -1 marks a row wrap.
+        for nk in (current - 1 if cx > 0 else -1, current + 1 if cx < w - 1 else -1, current - w, current + w):
+            if nk < 0 or nk >= n or nk in closed:
                 continue
-            if (nx, ny) in grid.occupants and (nx, ny) != start and (nx, ny) != goal:
+            # start/goal may hold a unit (the mover, or a target) and still count as free
+            if blk[nk] and nk != gk:
                 continue
-            tentative = g[current] + 1
-            if tentative < g.get((nx, ny), 1_000_000):
-                came_from[(nx, ny)] = current
-                g[(nx, ny)] = tentative
-                f[(nx, ny)] = tentative + abs(gx - nx) + abs(gy - ny)
-                if (nx, ny) not in open_set:
-                    open_set.add((nx, ny))
+            best = g_get(nk)
+            if best is None or ng < best:
+                came_from[nk] = current
+                g[nk] = ng
+                counter += 1
+                heappush(open_heap, (ng + abs(gx - nk % w) + abs(gy - nk // w), counter, ng, nk))
     return []
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections import deque
-from typing import Deque, List, Tuple
+from typing import Deque, List, Optional, Tuple
 
 from ..components import AP, Motion, Patrol, Position
 from ..ecs import World
@@ -12,15 +12,21 @@ from ..pathing import astar
 class PatrolAI:
     """
     Tiny patrol AI: walks between waypoints, looping. Consumes AP like the player.
+    Legs are planned once (terrain only) and sliced per tick; A* runs live only
+    when a wall or another unit blocks the slice or the unit is off its cached leg.
     """
 
     def __init__(self, world: World, grid: Grid) -> None:
         self.world = world
         self.grid = grid
+        self._q_patrols = world.query(Position, AP, Patrol)  # fetched every tick
 
     def update(self) -> None:
-        eids, rows = self.world.view(Position, AP, Patrol)
-        for eid, (pos, ap, pat) in zip(eids, rows):
+        eids, (positions, aps, patrols) = self._q_patrols()
+        for i, eid in enumerate(eids):
+            pos = positions[i]
+            ap = aps[i]
+            pat = patrols[i]
             if ap.current <= 0 or not pat.waypoints:
                 continue
             target = pat.waypoints[pat.idx % len(pat.waypoints)]
@@ -28,7 +34,9 @@ class PatrolAI:
                 pat.idx = (pat.idx + 1) % len(pat.waypoints)
                 target = pat.waypoints[pat.idx]
 
-            path = astar(self.grid, (pos.gx, pos.gy), target, max_len=ap.current + 1)
+            path = self._leg_prefix(pat, (pos.gx, pos.gy), ap.current + 1)
+            if path is None:
+                path = astar(self.grid, (pos.gx, pos.gy), target, max_len=ap.current + 1)
             if len(path) <= 1:
                 continue
 
@@ -36,7 +44,28 @@ class PatrolAI:
             if not motion:
                 motion = Motion()
                 self.world.add(eid, motion)
-            motion.path.clear()
-            for step in path[1:]:
-                motion.path.append(step)
+            w = self.grid.w
+            del motion.path[:]
+            motion.path.extend([y * w + x for x, y in path[1:]])
+            motion.cursor = 0
             # Only schedule once per tick; MotionSystem consumes AP.
+
+    def _leg_prefix(self, pat: Patrol, start: Tuple[int, int], max_len: int) -> Optional[List[Tuple[int, int]]]:
+        """Cached leg toward pat.idx from start, capped at max_len; None if a live A* is needed."""
+        if pat.cached_legs is None:
+            wps = pat.waypoints
+            pat.cached_legs = [astar(self.grid, wps[i - 1], wps[i], ignore_occupants=True) for i in range(len(wps))]
+        leg = pat.cached_legs[pat.idx % len(pat.waypoints)]
+        try:
+            j = leg.index(start)
+        except ValueError:
+            return None  # off the route (detoured or unreachable leg)
+        path = leg[j : j + max_len]
+        # Live blockers catch walls placed since planning as well as units;
+        # path[1:] never holds the unit's own cell.
+        w = self.grid.w
+        blk = self.grid.blockers()
+        for x, y in path[1:]:
+            if blk[y * w + x]:
+                return None
+        return path
@@ -57,9 +57,7 @@ class GameScene(Scene):
         self.motion_sys = MotionSystem(world, grid)
         self.ai = PatrolAI(world, grid)
         self.font = pygame.font.SysFont("consolas,menlo,monaco,dejavu sans mono", 14)
-        self.renderer = RenderSystem(world, grid, camera, screen, self.font)
-
-        self._hud_fps_txt: pygame.Surface | None = None
+        self.renderer = RenderSystem(world, grid, camera, screen, self.font, self.controller, clock)
 
         # toggle debug
         bus.subscribe(ToggleDebug, self._toggle_debug)
@@ -97,15 +95,6 @@ class GameScene(Scene):
 
     def render(self, screen: pygame.Surface, alpha: float) -> None:
         self.renderer.render(alpha)
-        # HUD: FPS & cache stats (use the real clock)
-        if DEBUG.show_fps:
-            fps = self.clock.get_fps()
-            txt = self.font.render(f"{fps:5.1f} fps", True, (255, 255, 255))
-            screen.blit(txt, (8, 6))
-        if DEBUG.show_cache_stats:
-            cs = self.world.cache_stats
-            txt = self.font.render(f"views cache: {cs.hits}/{cs.misses}", True, (200, 200, 240))
-            screen.blit(txt, (8, 24))
 
 
 def build_world(bus: EventBus) -> tuple[World, Grid, Camera]:
@@ -116,11 +105,9 @@ def build_world(bus: EventBus) -> tuple[World, Grid, Camera]:
     # Terrain: carve obstacles
     # Simple walls and a central building
     for x in range(5, 35):
-        grid.walkable[10][x] = False
-        grid.opaque[10][x] = True
+        grid.place_wall(x, 10)
     for y in range(3, 20):
-        grid.walkable[y][20] = False
-        grid.opaque[y][20] = True
+        grid.place_wall(20, y)
 
     # Entities
     # Player unit
@@ -163,8 +150,8 @@ def main() -> None:
     # Select player on start for convenience
     from .events import SelectEntity
 
-    eids, _ = world.view(Faction, Position)
-    for eid, (fac, pos) in zip(eids, _):
+    eids, (factions, _) = world.view(Faction, Position)
+    for eid, fac in zip(eids, factions):
         if fac.name == "player":
             bus.publish(SelectEntity(eid))
             break
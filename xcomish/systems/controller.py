@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Optional, Tuple, List
 
 from ..components import AP, Faction, Motion, PathPlan, Position, Selected
@@ -24,14 +25,23 @@ class ControllerSystem:
         bus.subscribe(HoverTileChanged, self._on_hover, once=False)
         bus.subscribe(MoveCommand, self._on_move, once=False)
 
-        self._reachable: set[tuple[int, int]] = set()
+        self._reachable: set[int] = set()  # packed y * w + x
+        self._selected_eid: Optional[int] = None  # mirrors the lone Selected tag
+        # Latest hovered tile not yet previewed; hovers are coalesced to one A* per update
+        self._pending_hover: Optional[Tuple[int, int]] = None
+        # (eid, gx, gy, ap.current, grid.revision) that FOV/reachability were last computed for
+        self._sync_key: Optional[Tuple[int, int, int, int, int]] = None
+        # Mouse movement repeats near-identical queries; grid.revision in the key keeps hits valid
+        self._path_cache = lru_cache(maxsize=64)(self._plan_path)
 
     # --- Events ---
     def _on_select(self, ev: SelectEntity) -> None:
+        self._path_cache.cache_clear()
+
         # clear previous selection
-        eids, _ = self.world.view(Selected)
-        for eid in eids:
-            self.world.remove(eid, Selected)
+        if self._selected_eid is not None:
+            self.world.remove(self._selected_eid, Selected)
+            self._selected_eid = None
 
         # select only player entities
         fac = self.world.get(ev.entity, Faction)
@@ -39,6 +49,7 @@ class ControllerSystem:
             return
 
         self.world.add(ev.entity, Selected())
+        self._selected_eid = ev.entity
 
         # ensure AP exists
         ap = self.world.get(ev.entity, AP)
@@ -54,32 +65,39 @@ class ControllerSystem:
         ap = self.world.get(ev.entity, AP)
         if ap and pos:
             self._reachable = reachable_flood(self.grid, (pos.gx, pos.gy), ap.current)
+            self._sync_key = (ev.entity, pos.gx, pos.gy, ap.current, self.grid.revision)
 
         # attach a PathPlan for preview state
         if not self.world.get(ev.entity, PathPlan):
             self.world.add(ev.entity, PathPlan())
 
     def _on_hover(self, ev: HoverTileChanged) -> None:
+        # Only the last hover before the next update matters; earlier ones are dropped
+        self._pending_hover = (ev.x, ev.y)
+
+    def _preview_path(self, tx: int, ty: int) -> None:
         # Preview path for selected entity
-        eids, rows = self.world.view(Selected, Position, AP, PathPlan)
-        if not eids:
+        eid = self._selected_eid
+        if eid is None:
             return
-        eid = eids[0]
-        _, pos, ap, plan = rows[0]
-        if (ev.x, ev.y) not in self._reachable:
+        pos = self.world.get(eid, Position)
+        ap = self.world.get(eid, AP)
+        plan = self.world.get(eid, PathPlan)
+        if not pos or not ap or not plan:
+            return
+        if not self.grid.in_bounds(tx, ty) or ty * self.grid.w + tx not in self._reachable:
             plan.path = []
             plan.target = None
             return
 
-        path = astar(self.grid, (pos.gx, pos.gy), (ev.x, ev.y), max_len=ap.current + 1)
+        path = self._path_cache((pos.gx, pos.gy), (tx, ty), ap.current + 1, self.grid.revision)
         # Exclude start for a cleaner draw; but keep target.
         plan.path = path[1:] if len(path) > 1 else []
-        plan.target = (ev.x, ev.y)
+        plan.target = (tx, ty)
 
     def _on_move(self, ev: MoveCommand) -> None:
         # Only allow moving the selected entity
-        eids, _ = self.world.view(Selected)
-        if not eids or eids[0] != ev.entity:
+        if self._selected_eid != ev.entity:
             return
 
         pos = self.world.get(ev.entity, Position)
@@ -87,12 +105,14 @@ class ControllerSystem:
         if not pos or not ap:
             return
 
-        if (ev.target[0], ev.target[1]) not in self._reachable:
+        tx, ty = ev.target
+        if not self.grid.in_bounds(tx, ty) or ty * self.grid.w + tx not in self._reachable:
             return
 
-        path = astar(self.grid, (pos.gx, pos.gy), ev.target, max_len=ap.current + 1)
+        path = self._path_cache((pos.gx, pos.gy), ev.target, ap.current + 1, self.grid.revision)
         if len(path) <= 1:
             return
+        self._path_cache.cache_clear()
 
         # Convert to motion path (exclude current cell)
         motion = self.world.get(ev.entity, Motion)
@@ -100,26 +120,53 @@ class ControllerSystem:
             motion = Motion()
             self.world.add(ev.entity, motion)
 
-        motion.path.clear()
-        for step in path[1:]:
-            motion.path.append(step)
+        w = self.grid.w
+        del motion.path[:]
+        motion.path.extend([y * w + x for x, y in path[1:]])
+        motion.cursor = 0
 
-        # Clear preview
+        # Clear preview (including a hover still waiting for the next update)
+        self._pending_hover = None
         plan = self.world.get(ev.entity, PathPlan)
         if plan:
             plan.path = []
             plan.target = None
 
+    def _plan_path(
+        self, start: Tuple[int, int], target: Tuple[int, int], max_len: int, revision: int
+    ) -> List[Tuple[int, int]]:
+        # Only called through _path_cache; revision is part of the key, not used here.
+        # Callers must not mutate the returned (shared) list.
+        return astar(self.grid, start, target, max_len=max_len)
+
     # --- Update (called every fixed step) ---
     def update(self) -> None:
         # Keep FOV synced to currently selected unit
-        eids, rows = self.world.view(Selected, Position, AP)
-        if eids:
-            _, pos, ap = rows[0]
-            self.grid.reveal_from(pos.gx, pos.gy, FOV_RADIUS)
-            self._reachable = reachable_flood(self.grid, (pos.gx, pos.gy), ap.current)
+        eid = self._selected_eid
+        if eid is not None:
+            pos = self.world.get(eid, Position)
+            ap = self.world.get(eid, AP)
+            if pos and ap:
+                # Both only depend on this key (revision covers walls and other units)
+                key = (eid, pos.gx, pos.gy, ap.current, self.grid.revision)
+                if key != self._sync_key:
+                    self._sync_key = key
+                    self.grid.reveal_from(pos.gx, pos.gy, FOV_RADIUS)
+                    self._reachable = reachable_flood(self.grid, (pos.gx, pos.gy), ap.current)
+
+        # Drain the coalesced hover against the fresh reachability
+        hover = self._pending_hover
+        if hover is not None:
+            self._pending_hover = None
+            self._preview_path(*hover)
 
     # Exposed for RenderSystem
     @property
-    def reachable(self) -> set[tuple[int, int]]:
+    def selected(self) -> Optional[int]:
+        """Entity id of the selected unit, or None."""
+        return self._selected_eid
+
+    @property
+    def reachable(self) -> set[int]:
+        """Reachable cells as packed y * grid.w + x ints."""
         return self._reachable
@@ -47,14 +47,15 @@ class InputSystem:
 
             # Left-click select player unit on tile, if any
             if ev.button == 1:
-                eids, rows = self.world.view(Position, Faction)
-                for eid, (pos, fac) in zip(eids, rows):
+                eids, (positions, factions) = self.world.view(Position, Faction)
+                for i, eid in enumerate(eids):
+                    pos, fac = positions[i], factions[i]
                     if fac.name == "player" and (pos.gx, pos.gy) == (gx, gy):
                         self.bus.publish(SelectEntity(eid))
                         break
             # Right-click move selected
             elif ev.button == 3:
                 # Find selected entity
-                eids, rows = self.world.view(Selected, Position)
+                eids, _ = self.world.view(Selected, Position)
                 if eids:
                     self.bus.publish(MoveCommand(eids[0], (gx, gy)))
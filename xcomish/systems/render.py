@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pygame
 
-from ..components import Faction, PathPlan, Position, Renderable, Selected, AP
+from ..components import Faction, PathPlan, Position, Renderable, AP
 from ..constants import (
     BLUE,
     GREEN,
@@ -20,27 +22,88 @@ from ..constants import (
 from ..ecs import World
 from ..grid import Camera, Grid
 
+if TYPE_CHECKING:
+    from .controller import ControllerSystem
+
+# AP pip strip geometry
+_PIP_W, _PIP_GAP, _PIP_H = 4, 1, 6
+_MAX_PIPS = 12
+_PIP_STEP = _PIP_W + _PIP_GAP
+
 
 class RenderSystem:
     """
-    Deterministic draw order; minimal allocations; viewport-scoped fog draw.
+    Deterministic draw order; minimal allocations; fog is one blit of the grid's overlay.
     """
 
-    def __init__(self, world: World, grid: Grid, camera: Camera, screen: pygame.Surface, font: pygame.font.Font) -> None:
+    def __init__(
+        self,
+        world: World,
+        grid: Grid,
+        camera: Camera,
+        screen: pygame.Surface,
+        font: pygame.font.Font,
+        controller: ControllerSystem,
+        clock: pygame.time.Clock,
+    ) -> None:
         self.world = world
         self.grid = grid
         self.camera = camera
         self.screen = screen
         self.font = font
+        self.controller = controller  # source of the selected entity id
+        self._q_units = world.query(Position, Renderable, Faction, AP)  # fetched every frame
+        self.clock = clock  # the main loop's clock; a fresh Clock always reports 0 fps
+
+        # FPS text is re-rasterized only when the integer value changes
+        self._fps_value = -1
+        self._fps_surf: pygame.Surface | None = None
 
         map_px_w, map_px_h = self.grid.map_pixel_size()
         self.grid.ensure_surfaces(map_px_w, map_px_h)
 
+        # Tinted tile overlays, built once instead of per drawn tile
+        self._selection_tile = self._alpha_tile(SELECTION)
+        # Path preview pre-rasterized into one surface over the path's bounding box;
+        # rebuilt only when the controller hands PathPlan a new path list.
+        self._preview_src: list[tuple[int, int]] | None = None
+        self._preview_surf: pygame.Surface | None = None
+        self._preview_origin = (0, 0)  # world px of the surface's top-left
+
+        # Scratch rects reused every frame; draw/blit copy the values, so mutating is safe
+        self._view_rect = pygame.Rect(0, 0, 0, 0)
+        self._pip_area = pygame.Rect(0, 0, 0, _PIP_H)
+
+        # Full rows of pips, drawn once; each unit blits a prefix of each strip
+        self._pip_bg = self._pip_strip((70, 70, 70))
+        self._pip_fg = self._pip_strip(YELLOW)
+
     # ---- Helpers ----
-    def _draw_rect_alpha(self, color: tuple[int, int, int, int], rect: pygame.Rect) -> None:
-        s = pygame.Surface((rect.w, rect.h), pygame.SRCALPHA)
+    @staticmethod
+    def _alpha_tile(color: tuple[int, int, int, int]) -> pygame.Surface:
+        s = pygame.Surface((TILE, TILE), pygame.SRCALPHA)
         s.fill(color)
-        self.screen.blit(s, rect.topleft)
+        return s
+
+    @staticmethod
+    def _pip_strip(color: tuple[int, int, int]) -> pygame.Surface:
+        s = pygame.Surface((_MAX_PIPS * _PIP_STEP, _PIP_H), pygame.SRCALPHA)
+        for i in range(_MAX_PIPS):
+            pygame.draw.rect(s, color, (i * _PIP_STEP, 0, _PIP_W, _PIP_H), border_radius=1)
+        return s
+
+    def _path_preview(self, path: list[tuple[int, int]]) -> pygame.Surface:
+        if path is not self._preview_src:
+            xs = [x for x, _ in path]
+            ys = [y for _, y in path]
+            x0, y0 = min(xs), min(ys)
+            surf = pygame.Surface(((max(xs) - x0 + 1) * TILE, (max(ys) - y0 + 1) * TILE), pygame.SRCALPHA)
+            for x, y in path:
+                surf.fill(PATH, ((x - x0) * TILE, (y - y0) * TILE, TILE, TILE))
+            self._preview_src = path
+            self._preview_surf = surf
+            self._preview_origin = (x0 * TILE, y0 * TILE)
+        return self._preview_surf
 
     # ---- Main ----
     def render(self, alpha: float) -> None:
@@ -48,86 +111,53 @@ class RenderSystem:
         g = self.grid
 
         # Terrain
-        src = pygame.Rect(cam.x, cam.y, cam.w, cam.h)
+        src = self._view_rect
+        src.update(cam.x, cam.y, cam.w, cam.h)
         self.screen.blit(g.terrain_surf, (0, 0), area=src)
         if DEBUG.show_grid:
             self.screen.blit(g.gridlines_surf, (0, 0), area=src)
 
-        # Reachable tiles (UI)
-        if DEBUG.show_reachable:
-            # Ask ControllerSystem for reachability by peeking PathPlan/Selected entity
-            # (We don't import ControllerSystem; instead, re-derive quickly for selected)
-            eids, rows = self.world.view(Selected, Position, AP)
-            if eids:
-                _, pos, ap = rows[0]
-                # Draw from grid.visible to avoid flooding whole map visually
-                # We'll just tint tiles in camera viewport that are reachable.
-                start_gx = cam.x // TILE
-                start_gy = cam.y // TILE
-                end_gx = (cam.x + cam.w) // TILE + 1
-                end_gy = (cam.y + cam.h) // TILE + 1
-                # Iterate reachable by path preview (stored by Controller in PathPlan)
-                # Safer: reconstruct in render is expensive; instead draw preview only.
-                pass  # real reachable tint handled by Controller via PathPlan? We'll do preview next.
-
         # Selection + path preview
-        eids, rows = self.world.view(Selected, Position, PathPlan)
-        if eids:
-            _, pos, plan = rows[0]
+        sel = self.controller.selected
+        pos = self.world.get(sel, Position) if sel is not None else None
+        plan = self.world.get(sel, PathPlan) if sel is not None else None
+        if pos and plan:
             if plan.path:
-                for gx, gy in plan.path:
-                    sx, sy = cam.world_to_screen(gx * TILE, gy * TILE)
-                    rect = pygame.Rect(sx, sy, TILE, TILE)
-                    self._draw_rect_alpha(PATH, rect)
+                surf = self._path_preview(plan.path)
+                self.screen.blit(surf, cam.world_to_screen(*self._preview_origin))
 
             # Selection highlight
-            sx, sy = cam.world_to_screen(pos.gx * TILE, pos.gy * TILE)
-            rect = pygame.Rect(sx, sy, TILE, TILE)
-            self._draw_rect_alpha(SELECTION, rect)
+            self.screen.blit(self._selection_tile, cam.world_to_screen(pos.gx * TILE, pos.gy * TILE))
 
         # Entities
-        eids, rows = self.world.view(Position, Renderable, Faction, AP)
-        for eid, (pos, rend, fac, ap) in zip(eids, rows):
-            cx, cy = (pos.px + (pos.gx - pos.px) * alpha), (pos.py + (pos.gy - pos.py) * alpha)
-            wx, wy = int(cx * TILE + TILE // 2), int(cy * TILE + TILE // 2)
-            sx, sy = cam.world_to_screen(wx, wy)
+        _, (positions, rends, factions, aps) = self._q_units()
+        # Interpolated screen centres for the whole column in one pass
+        centres = cam.positions_to_screen_batch(positions, alpha)
+        for (sx, sy), rend, fac, ap in zip(centres, rends, factions, aps):
             color = PLAYER if fac.name == "player" else RED
             pygame.draw.circle(self.screen, color, (sx, sy), rend.radius_px)
 
-            # AP pips
-            pip_w = 4
-            gap = 1
-            max_pips = min(12, ap.maximum)
+            # AP pips: grey row for the maximum, yellow prefix for what's left
+            max_pips = min(_MAX_PIPS, ap.maximum)
             draw_pips = min(ap.current, max_pips)
-            base_x = sx - ((max_pips * (pip_w + gap)) // 2)
-            y = sy - rend.radius_px - 10
-            for i in range(max_pips):
-                rect = pygame.Rect(base_x + i * (pip_w + gap), y, pip_w, 6)
-                pygame.draw.rect(self.screen, (70, 70, 70), rect, border_radius=1)
-            for i in range(draw_pips):
-                rect = pygame.Rect(base_x + i * (pip_w + gap), y, pip_w, 6)
-                pygame.draw.rect(self.screen, YELLOW, rect, border_radius=1)
-
-        # Fog of war (viewport-scoped)
-        start_gx = cam.x // TILE
-        start_gy = cam.y // TILE
-        end_gx = (cam.x + cam.w) // TILE + 1
-        end_gy = (cam.y + cam.h) // TILE + 1
-        for gy in range(start_gy, min(end_gy, g.h)):
-            for gx in range(start_gx, min(end_gx, g.w)):
-                if (gx, gy) in g.visible:
-                    continue
-                sx, sy = cam.world_to_screen(gx * TILE, gy * TILE)
-                if (gx, gy) in g.explored:
-                    self.screen.blit(g.fog_dim, (sx, sy))
-                else:
-                    self.screen.blit(g.fog_full, (sx, sy))
+            dest = (sx - ((max_pips * _PIP_STEP) // 2), sy - rend.radius_px - 10)
+            area = self._pip_area
+            area.w = max_pips * _PIP_STEP
+            self.screen.blit(self._pip_bg, dest, area=area)
+            area.w = draw_pips * _PIP_STEP
+            self.screen.blit(self._pip_fg, dest, area=area)
+
+        # Fog of war: Grid keeps the overlay current per tile, so this is one blit
+        self.screen.blit(g.fog_surf, (0, 0), area=src)
 
         # HUD / debug
         y = 6
         if DEBUG.show_fps:
-            fps_text = self.font.render(f"FPS: {int(pygame.time.get_ticks() and pygame.time.Clock().get_fps())}", True, WHITE)
-            self.screen.blit(fps_text, (8, y))
+            fps = int(self.clock.get_fps())
+            if self._fps_surf is None or fps != self._fps_value:
+                self._fps_surf = self.font.render(f"FPS: {fps}", True, WHITE)
+                self._fps_value = fps
+            self.screen.blit(self._fps_surf, (8, y))
             y += 18
         if DEBUG.show_cache_stats:
             cs = self.world.cache_stats